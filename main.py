@@ -4,8 +4,10 @@ Script principal para el simulador de Máquinas de Turing
 
 import sys
 import argparse
-from turing_machine import TuringMachine
-from yaml_parser import parse_yaml_file
+
+# Separadores de la salida
+SEPARATOR = "-" * 80
+SECTION_END = "\n" + "=" * 80 + "\n"
 
 
 def main():
@@ -22,6 +24,12 @@ def main():
     
     args = parser.parse_args()
     
+    # Importar aquí (y no al cargar el módulo) las dependencias del simulador,
+    # así importar main no carga PyYAML ni Numba (y con la caché ni siquiera
+    # se carga PyYAML al ejecutar)
+    from turing_machine import TuringMachine
+    from yaml_parser import parse_yaml_file, YAMLParseError
+    
     try:
         # Parsear archivo YAML
         print(f"Cargando configuración desde: {args.yaml_file}")
@@ -37,32 +45,27 @@ def main():
         print(f"Alfabeto de cinta: {tm.tape_alphabet}")
         print(f"Transiciones: {len(tm.transitions)}")
         print(f"Cadenas a simular: {len(tm.simulation_strings)}")
-        print("\n" + "="*80 + "\n")
+        print(SECTION_END)
         
-        # Simular cada cadena
-        for i, input_string in enumerate(tm.simulation_strings, 1):
-            print(f"Simulación {i}: Cadena de entrada: '{input_string}'")
-            print("-" * 80)
-            
-            instant_descriptions, accepted = tm.simulate(input_string)
+        # Simular las cadenas y mostrar cada resultado apenas está listo
+        results = tm.simulate_iter(tm.simulation_strings)
+        for i, (input_string, (instant_descriptions, accepted)) in enumerate(
+                zip(tm.simulation_strings, results), 1):
+            # Todas las descripciones instantáneas en un solo string
+            steps = "\n".join([f"Paso {step}: {id_str}"
+                               for step, id_str in enumerate(instant_descriptions)])
+            result = "ACEPTADA" if accepted else "RECHAZADA"
             
-            # Mostrar todas las descripciones instantáneas
-            for step, id_str in enumerate(instant_descriptions):
-                print(f"Paso {step}: {id_str}")
-            
-            # Mostrar resultado
-            print("-" * 80)
-            if accepted:
-                print(f"RESULTADO: La cadena '{input_string}' fue ACEPTADA")
-            else:
-                print(f"RESULTADO: La cadena '{input_string}' fue RECHAZADA")
-            
-            print("\n" + "="*80 + "\n")
+            # Escribir la salida de la simulación de una sola vez
+            sys.stdout.write(f"Simulación {i}: Cadena de entrada: '{input_string}'\n"
+                             f"{SEPARATOR}\n{steps}\n{SEPARATOR}\n"
+                             f"RESULTADO: La cadena '{input_string}' fue {result}\n"
+                             f"{SECTION_END}\n")
     
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo '{args.yaml_file}'")
         sys.exit(1)
-    except yaml.YAMLError as e:
+    except YAMLParseError as e:
         print(f"Error al parsear el archivo YAML: {e}")
         sys.exit(1)
     except ValueError as e:
@@ -74,6 +77,8 @@ def main():
         traceback.print_exc()
         sys.exit(1)
 
-main()
+
+if __name__ == "__main__":
+    main()
 
 
@@ -3,13 +3,38 @@ Simulador de Máquinas de Turing
 Implementa la lógica para simular una MT de una cinta
 """
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 
+# Numba es opcional: si no está instalado se usa el simulador en Python puro
+try:
+    import numpy as np
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    np = None
+    njit = None
+
+
+MAX_STEPS = 10000  # Límite de pasos para evitar bucles infinitos
+
+# Hash polinomial del contenido de la cinta, usado para detectar configuraciones
+# repetidas (ciclos). Dos módulos primos de 31 bits para que los productos
+# quepan en int64 dentro de Numba; el blank (id 0) no aporta al hash.
+_HASH_MOD_1, _HASH_BASE_1 = 2147483647, 16807
+_HASH_MOD_2, _HASH_BASE_2 = 2147483629, 48271
+
+# Desplazamiento de la cabeza para cada dirección ('S' o cualquier otro valor no la mueve)
+DISPLACEMENTS = {'L': -1, 'R': 1, 'S': 0}
+
 
 @dataclass
 class Transition:
     """Representa una transición de la MT"""
+    # __slots__ explícito en lugar de dataclass(slots=True) para seguir
+    # soportando Python 3.7
+    __slots__ = ('initial_state', 'mem_cache_value', 'tape_input', 'final_state',
+                 'new_mem_cache_value', 'tape_output', 'tape_displacement', 'disp')
+    
     initial_state: str
     mem_cache_value: Optional[str]  # Puede ser None (blank)
     tape_input: str
@@ -17,6 +42,124 @@ class Transition:
     new_mem_cache_value: Optional[str]  # Puede ser None (blank)
     tape_output: Optional[str]  # Puede ser None (blank)
     tape_displacement: str  # 'L', 'R', o 'S'
+    
+    def __post_init__(self):
+        # Desplazamiento ya resuelto a -1, 1 o 0 (slot fuera de los campos del dataclass)
+        self.disp = DISPLACEMENTS.get(self.tape_displacement, 0)
+
+
+def _normalize(value):
+    """Normaliza los valores blank de YAML (null o string vacío) a None"""
+    if value is None or value == '':
+        return None
+    return value
+
+
+def _intern(ids: Dict, names: List, value) -> int:
+    """Devuelve el identificador entero de un valor, asignándole uno nuevo si no existe"""
+    value_id = ids.get(value)
+    if value_id is None:
+        value_id = len(names)
+        ids[value] = value_id
+        names.append(value)
+    return value_id
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _pow_mod(base, exponent, mod):
+        """Calcula base ** exponent % mod por cuadrados sucesivos (compilado con Numba)"""
+        result = 1
+        base %= mod
+        while exponent > 0:
+            if exponent & 1:
+                result = result * base % mod
+            base = base * base % mod
+            exponent >>= 1
+        return result
+    
+    @njit(cache=True)
+    def _run(tape, position, length, state_id, mem_id, keys, next_state, next_mem, write_sym, disp,
+             final_state_id, max_steps, record, trace_pos, trace_state, trace_mem, trace_write):
+        """
+        Ejecuta los pasos de la MT sobre una cinta preasignada (compilado con Numba)
+        
+        La entrada ocupa las celdas [position, position + length). Si record es
+        True registra en los arreglos trace_* la posición, estado, memoria y
+        símbolo escrito de cada paso para reconstruir luego las descripciones
+        instantáneas (si no, los arreglos no se tocan). Se detiene (rechazando) si una configuración se repite.
+        
+        Returns:
+            Tupla con (cantidad de pasos, aceptada)
+        """
+        n = keys.shape[0]
+        
+        # Hash inicial de la cinta: solo la entrada, las demás celdas son blank
+        hash_1 = 0
+        hash_2 = 0
+        for cell in range(position, position + length):
+            symbol = np.int64(tape[cell])
+            if symbol:
+                hash_1 = (hash_1 + symbol * _pow_mod(_HASH_BASE_1, cell, _HASH_MOD_1)) % _HASH_MOD_1
+                hash_2 = (hash_2 + symbol * _pow_mod(_HASH_BASE_2, cell, _HASH_MOD_2)) % _HASH_MOD_2
+        seen = dict()
+        
+        if record:
+            trace_pos[0] = position
+            trace_state[0] = state_id
+            trace_mem[0] = mem_id
+        step = 0
+        while step < max_steps:
+            config = ((state_id << 16) | mem_id, position, (hash_1 << 31) | hash_2)
+            if config in seen:
+                break
+            seen[config] = True
+            
+            key = (state_id << 32) | (mem_id << 16) | np.int64(tape[position])
+            i = np.searchsorted(keys, key)
+            if i == n or keys[i] != key:
+                break
+            delta = np.int64(write_sym[i]) - np.int64(tape[position])
+            if delta:
+                hash_1 = (hash_1 + delta * _pow_mod(_HASH_BASE_1, position, _HASH_MOD_1)) % _HASH_MOD_1
+                hash_2 = (hash_2 + delta * _pow_mod(_HASH_BASE_2, position, _HASH_MOD_2)) % _HASH_MOD_2
+            tape[position] = write_sym[i]
+            state_id = next_state[i]
+            mem_id = next_mem[i]
+            position += disp[i]
+            step += 1
+            if record:
+                trace_pos[step] = position
+                trace_state[step] = state_id
+                trace_mem[step] = mem_id
+                trace_write[step] = write_sym[i]
+            if state_id == final_state_id:
+                return step, True
+        return step, False
+    
+    @njit(parallel=True, cache=True)
+    def _run_batch(tapes, position, lengths, state_id, keys, next_state, next_mem, write_sym, disp,
+                   final_state_id, max_steps, record, trace_pos, trace_state, trace_mem, trace_write):
+        """
+        Ejecuta _run sobre cada fila de tapes en paralelo (una cadena por fila,
+        de largo lengths[i])
+        
+        Returns:
+            Tupla con (pasos de cada cadena, aceptación de cada cadena)
+        """
+        n = tapes.shape[0]
+        steps = np.empty(n, dtype=np.int64)
+        accepted = np.empty(n, dtype=np.bool_)
+        for i in prange(n):
+            row_steps, row_accepted = _run(tapes[i], position, lengths[i], state_id, 0, keys, next_state,
+                                           next_mem, write_sym, disp, final_state_id, max_steps, record,
+                                           trace_pos[i], trace_state[i], trace_mem[i], trace_write[i])
+            steps[i] = row_steps
+            accepted[i] = row_accepted
+        return steps, accepted
+else:
+    _run = None
+    _run_batch = None
 
 
 class TuringMachine:
@@ -44,38 +187,112 @@ class TuringMachine:
             params = delta_item['params']
             output = delta_item['output']
             
-            # Manejar valores null/None de YAML
-            mem_cache_in = params.get('mem_cache_value')
-            if mem_cache_in is None or mem_cache_in == '':
-                mem_cache_in = None
-            
-            tape_input = params['tape_input']
-            # Si tape_input es None o string vacío, representa blank
-            if tape_input is None or tape_input == '':
-                tape_input = None
-            
-            mem_cache_out = output.get('mem_cache_value')
-            if mem_cache_out is None or mem_cache_out == '':
-                mem_cache_out = None
-            
-            tape_output = output.get('tape_output')
-            if tape_output is None or tape_output == '':
-                tape_output = None
-            
             transition = Transition(
                 initial_state=params['initial_state'],
-                mem_cache_value=mem_cache_in,
-                tape_input=tape_input,
+                mem_cache_value=_normalize(params.get('mem_cache_value')),
+                tape_input=_normalize(params['tape_input']),
                 final_state=output['final_state'],
-                new_mem_cache_value=mem_cache_out,
-                tape_output=tape_output,
+                new_mem_cache_value=_normalize(output.get('mem_cache_value')),
+                tape_output=_normalize(output.get('tape_output')),
                 tape_displacement=output['tape_displacement']
             )
             self.transitions.append(transition)
         
+        # Identificadores enteros para estados, memoria y símbolos de cinta.
+        # El id 0 de memoria y de cinta se reserva para blank (None). Los ids de
+        # cinta caben en un byte; _byte_to_char los traduce al carácter a mostrar
+        # mientras todos los símbolos sean un único carácter latin-1 (si no, es la
+        # identidad y _sym_text, el texto de cada símbolo, se aplica al final).
+        self._state_id: Dict[str, int] = {}
+        self._state_names: List[str] = []
+        self._mem_id: Dict[Optional[str], int] = {None: 0}
+        self._mem_names: List[Optional[str]] = [None]
+        self._sym_id: Dict[Optional[str], int] = {None: 0}
+        self._sym_names: List[Optional[str]] = [None]
+        self._sym_text: List[str] = ['B']  # B representa blank
+        self._byte_to_char = bytearray(256)
+        self._byte_to_char[0] = ord('B')
+        self._wide_symbols = False
+        
+        # Parte "[estado,memoria]" de las IDs, por (estado << 16) | memoria
+        self._state_parts: Dict[int, str] = {}
+        _intern(self._state_id, self._state_names, self.initial_state)
+        _intern(self._state_id, self._state_names, self.final_state)
+        
+        # Tabla de búsqueda indexada por la clave empaquetada
+        # (estado << 32) | (memoria << 16) | símbolo, y en paralelo la acción
+        # ya traducida a ids: (estado final, memoria nueva, símbolo escrito, desplazamiento -1/0/1).
+        # Si hay claves repetidas se conserva la primera, como en la búsqueda lineal.
+        self._table: Dict[int, Transition] = {}
+        self._actions: Dict[int, Tuple[int, int, int, int]] = {}
+        for transition in self.transitions:
+            key = ((_intern(self._state_id, self._state_names, transition.initial_state) << 32)
+                   | (_intern(self._mem_id, self._mem_names, transition.mem_cache_value) << 16)
+                   | self._encode_symbol(transition.tape_input))
+            if key in self._table:
+                continue
+            self._table[key] = transition
+            self._actions[key] = (
+                _intern(self._state_id, self._state_names, transition.final_state),
+                _intern(self._mem_id, self._mem_names, transition.new_mem_cache_value),
+                self._encode_symbol(transition.tape_output),
+                transition.disp,
+            )
+        
+        # Tabla en arreglos paralelos (uno por campo) ordenados por clave para
+        # buscar con np.searchsorted en el kernel de Numba
+        if np is not None:
+            keys = np.fromiter(self._actions, dtype=np.int64, count=len(self._actions))
+            rows = np.array(list(self._actions.values()), dtype=np.int64).reshape(-1, 4)
+            order = np.argsort(keys)
+            self._keys = keys[order]
+            self._next_state = np.ascontiguousarray(rows[order, 0])
+            self._next_mem = np.ascontiguousarray(rows[order, 1])
+            self._write_sym = rows[order, 2].astype(np.uint8)
+            self._disp = np.ascontiguousarray(rows[order, 3])
+        
         # Cadenas a simular
         self.simulation_strings = config.get('simulation_strings', [])
     
+    def _encode_symbol(self, symbol: Optional[str]) -> int:
+        """
+        Devuelve el id (un byte) de un símbolo de cinta, registrándolo si es nuevo
+        
+        Args:
+            symbol: Símbolo de cinta (None representa blank)
+            
+        Returns:
+            Id del símbolo
+        """
+        symbol_id = self._sym_id.get(symbol)
+        if symbol_id is None:
+            if len(self._sym_names) > 0xFF:
+                raise ValueError("La cinta admite como máximo 255 símbolos distintos")
+            symbol_id = _intern(self._sym_id, self._sym_names, symbol)
+            text = str(symbol)
+            self._sym_text.append(text)
+            if not self._wide_symbols:
+                if len(text) == 1 and ord(text) <= 0xFF:
+                    self._byte_to_char[symbol_id] = ord(text)
+                else:
+                    self._wide_symbols = True
+                    self._byte_to_char = bytearray(range(256))
+        return symbol_id
+    
+    def _render_tape(self, rendered: bytearray) -> str:
+        """
+        Convierte celdas ya traducidas con _byte_to_char al texto de la cinta
+        
+        Args:
+            rendered: Bytes con las celdas traducidas
+            
+        Returns:
+            String con los símbolos de la cinta
+        """
+        if self._wide_symbols:
+            return rendered.decode('latin-1').translate(self._sym_text)
+        return rendered.decode('latin-1')
+    
     def find_transition(self, state: str, mem_cache: Optional[str], tape_symbol: Optional[str]) -> Optional[Transition]:
         """
         Busca una transición aplicable dado el estado actual, memoria y símbolo de la cinta
@@ -88,152 +305,315 @@ class TuringMachine:
         Returns:
             Transición aplicable o None si no hay ninguna
         """
-        # Convertir None a string vacío o manejar blank según la configuración
-        # En YAML, blank puede ser null, None, o string vacío
-        tape_input = tape_symbol if tape_symbol is not None else None
-        
-        for transition in self.transitions:
-            # Comparar estado y memoria
-            if transition.initial_state != state:
-                continue
-            if transition.mem_cache_value != mem_cache:
-                continue
-            
-            # Comparar símbolo de cinta (manejar blank)
-            transition_input = transition.tape_input
-            # Si la transición tiene None o string vacío, representa blank
-            if transition_input is None or transition_input == '':
-                transition_input = None
-            
-            if transition_input == tape_input:
-                return transition
-        
-        return None
+        try:
+            key = ((self._state_id[state] << 32)
+                   | (self._mem_id[mem_cache] << 16)
+                   | self._sym_id[tape_symbol])
+        except KeyError:
+            return None
+        return self._table.get(key)
     
-    def simulate(self, input_string: str) -> Tuple[List[str], bool]:
+    def simulate(self, input_string: str, record_ids: bool = True) -> Tuple[List[str], bool]:
         """
         Simula la ejecución de la MT con una cadena de entrada
         
+        La cadena se rechaza si la MT se detiene fuera del estado final, si
+        repite una configuración (ciclo) o si supera MAX_STEPS pasos.
+        
         Args:
             input_string: Cadena de entrada a simular
+            record_ids: Si es False no se arman las descripciones instantáneas
+                (la lista devuelta queda vacía)
             
         Returns:
             Tupla con (lista de descripciones instantáneas, aceptada)
         """
-        # Inicializar cinta: convertir la cadena en lista de símbolos
-        tape = list(input_string)
+        if _run is not None:
+            return next(self._simulate_compiled([input_string], record_ids))
+        
+        # Inicializar cinta: cada byte guarda el id del símbolo (0 es blank).
+        # rendered guarda en paralelo el carácter de cada celda para armar las IDs.
+        # tape_position es la posición lógica; la celda física es
+        # tape_position + origin, y [lo, hi) son las celdas lógicas ya usadas.
+        # Se reserva espacio de sobra con la entrada al centro; si la cabeza
+        # llega a un borde la cinta se duplica y se vuelve a centrar.
+        encoded = bytes(map(self._encode_symbol, input_string))
+        byte_to_char = self._byte_to_char
+        blank_char = byte_to_char[0]
+        capacity = max(1024, 4 * len(encoded))
+        origin = capacity // 2
+        tape = bytearray(capacity)
+        tape[origin:origin + len(encoded)] = encoded
+        rendered = bytearray((blank_char,)) * capacity
+        rendered[origin:origin + len(encoded)] = encoded.translate(byte_to_char)
+        lo, hi = 0, max(len(encoded), 1)
         tape_position = 0
-        current_state = self.initial_state
-        mem_cache = None  # Memoria/caché inicial
+        state_id = self._state_id[self.initial_state]
+        mem_id = 0  # Memoria/caché inicial (blank)
+        final_state_id = self._state_id[self.final_state]
         
         # Lista de descripciones instantáneas
         instant_descriptions = []
         
-        # Agregar descripción instantánea inicial
-        id_str = self._create_instant_description(tape, tape_position, current_state, mem_cache)
-        instant_descriptions.append(id_str)
+        # Configuraciones (estado y memoria, posición, hash de la cinta) ya vistas.
+        # La MT es determinista: si una se repite, está en un ciclo y no acepta.
+        # El hash usa como exponente tape_position + MAX_STEPS, que nunca es negativo
+        hash_1 = hash_2 = 0
+        for index, symbol_id in enumerate(encoded, MAX_STEPS):
+            hash_1 = (hash_1 + symbol_id * pow(_HASH_BASE_1, index, _HASH_MOD_1)) % _HASH_MOD_1
+            hash_2 = (hash_2 + symbol_id * pow(_HASH_BASE_2, index, _HASH_MOD_2)) % _HASH_MOD_2
+        seen = set()
         
-        max_steps = 10000  # Límite de pasos para evitar bucles infinitos
-        step = 0
+        # Métodos usados en cada paso, ligados a variables locales
+        add_seen = seen.add
+        find_action = self._actions.get
+        create_id = self._create_instant_description
+        append_id = instant_descriptions.append
         
-        while step < max_steps:
-            # Leer símbolo actual de la cinta
-            if tape_position < 0:
-                # Extender cinta hacia la izquierda con blank
-                tape.insert(0, None)  # None representa blank
-                tape_position = 0
-            elif tape_position >= len(tape):
-                # Extender cinta hacia la derecha con blank
-                tape.append(None)
-            
-            current_symbol = tape[tape_position] if tape[tape_position] is not None else None
+        # Agregar descripción instantánea inicial
+        if record_ids:
+            append_id(create_id(rendered, origin + lo, origin, origin + hi, state_id, mem_id))
+        
+        for _ in range(MAX_STEPS):
+            # Detectar ciclos
+            config = ((state_id << 16) | mem_id, tape_position, (hash_1 << 31) | hash_2)
+            if config in seen:
+                break
+            add_seen(config)
             
             # Buscar transición aplicable
-            transition = self.find_transition(current_state, mem_cache, current_symbol)
+            cell = tape_position + origin
+            action = find_action((state_id << 32) | (mem_id << 16) | tape[cell])
             
-            if transition is None:
+            if action is None:
                 # No hay transición aplicable
                 break
             
-            # Aplicar transición
-            current_state = transition.final_state
-            mem_cache = transition.new_mem_cache_value
+            # Aplicar transición y escribir en la cinta
+            state_id, mem_id, symbol_id, displacement = action
+            delta = symbol_id - tape[cell]
+            if delta:
+                index = tape_position + MAX_STEPS
+                hash_1 = (hash_1 + delta * pow(_HASH_BASE_1, index, _HASH_MOD_1)) % _HASH_MOD_1
+                hash_2 = (hash_2 + delta * pow(_HASH_BASE_2, index, _HASH_MOD_2)) % _HASH_MOD_2
+            tape[cell] = symbol_id
+            rendered[cell] = byte_to_char[symbol_id]
             
-            # Escribir en la cinta
-            if transition.tape_output is not None:
-                tape[tape_position] = transition.tape_output
-            else:
-                tape[tape_position] = None  # Blank
+            # Mover cabeza de la cinta ('S' tiene desplazamiento 0)
+            tape_position += displacement
             
-            # Mover cabeza de la cinta
-            if transition.tape_displacement == 'L':
-                tape_position -= 1
-            elif transition.tape_displacement == 'R':
-                tape_position += 1
-            # 'S' significa Stay, no movemos
+            cell = tape_position + origin
+            if not 0 <= cell < capacity:
+                # Duplicar la cinta copiando su contenido al centro de la nueva
+                shift = capacity // 2
+                new_tape = bytearray(2 * capacity)
+                new_tape[shift:shift + capacity] = tape
+                new_rendered = bytearray((blank_char,)) * (2 * capacity)
+                new_rendered[shift:shift + capacity] = rendered
+                tape, rendered = new_tape, new_rendered
+                capacity *= 2
+                origin += shift
+                cell += shift
+            if tape_position < lo:
+                lo = tape_position
+            elif tape_position >= hi:
+                hi = tape_position + 1
             
             # Agregar descripción instantánea
-            id_str = self._create_instant_description(tape, tape_position, current_state, mem_cache)
-            instant_descriptions.append(id_str)
+            if record_ids:
+                append_id(create_id(rendered, origin + lo, cell, origin + hi, state_id, mem_id))
             
             # Verificar si llegamos al estado final
-            if current_state == self.final_state:
+            if state_id == final_state_id:
                 return instant_descriptions, True
-            
-            step += 1
         
         # Si salimos del bucle, la cadena no fue aceptada
         return instant_descriptions, False
     
-    def _create_instant_description(self, tape: List[Optional[str]], 
-                                     position: int, 
-                                     state: str, 
-                                     mem_cache: Optional[str]) -> str:
+    def simulate_fast(self, input_string: str) -> bool:
         """
-        Crea una descripción instantánea (ID) de la configuración actual
+        Simula una cadena sin armar descripciones instantáneas
         
-        Formato: [estado, mem_cache] símbolo_actual resto_de_la_cinta
+        Args:
+            input_string: Cadena de entrada a simular
+            
+        Returns:
+            True si la cadena fue aceptada
+        """
+        return self.simulate(input_string, record_ids=False)[1]
+    
+    def simulate_iter(self, input_strings: List[str],
+                      record_ids: bool = True) -> Iterator[Tuple[List[str], bool]]:
+        """
+        Simula varias cadenas de entrada y entrega cada resultado apenas está
+        listo; con Numba se ejecutan en paralelo por bloques
         
         Args:
-            tape: Lista que representa la cinta
-            position: Posición de la cabeza de lectura/escritura
-            state: Estado actual
-            mem_cache: Valor en memoria/caché
+            input_strings: Cadenas de entrada a simular
+            record_ids: Si es False no se arman las descripciones instantáneas
             
         Returns:
-            String con la descripción instantánea
+            Iterador con una tupla (descripciones instantáneas, aceptada) por cadena
+        """
+        if _run_batch is None:
+            return (self.simulate(input_string, record_ids) for input_string in input_strings)
+        return self._simulate_compiled(input_strings, record_ids)
+    
+    def simulate_batch(self, input_strings: List[str],
+                       record_ids: bool = True) -> List[Tuple[List[str], bool]]:
         """
-        # Construir la parte del estado y memoria
-        state_part = f"[{state}"
-        if mem_cache is not None:
-            state_part += f",{mem_cache}"
-        state_part += "]"
-        
-        # Asegurar que la posición esté dentro de los límites de la cinta
-        if position < 0:
-            # La cabeza está a la izquierda de la cinta
-            return state_part + "B" + "".join(self._symbol_to_str(s) for s in tape)
-        elif position >= len(tape):
-            # La cabeza está a la derecha de la cinta
-            return "".join(self._symbol_to_str(s) for s in tape) + state_part + "B"
-        else:
-            # La cabeza está dentro de la cinta
-            left_part = "".join(self._symbol_to_str(s) for s in tape[:position])
-            current_symbol = self._symbol_to_str(tape[position])
-            right_part = "".join(self._symbol_to_str(s) for s in tape[position+1:])
-            return left_part + state_part + current_symbol + right_part
-    
-    def _symbol_to_str(self, symbol: Optional[str]) -> str:
-        """
-        Convierte un símbolo a string, manejando blank
+        Simula varias cadenas de entrada; con Numba se ejecutan en paralelo
         
         Args:
-            symbol: Símbolo (None representa blank)
+            input_strings: Cadenas de entrada a simular
+            record_ids: Si es False no se arman las descripciones instantáneas
             
         Returns:
-            String representando el símbolo
+            Lista con una tupla (descripciones instantáneas, aceptada) por cadena
         """
-        if symbol is None:
-            return "B"  # B representa blank
-        return symbol
-
+        return list(self.simulate_iter(input_strings, record_ids))
+    
+    def _simulate_compiled(self, input_strings: List[str],
+                           record_ids: bool = True) -> Iterator[Tuple[List[str], bool]]:
+        """
+        Igual que simulate_iter, pero ejecuta los pasos con el kernel compilado
+        _run_batch y luego reproduce las escrituras registradas para armar las IDs
+        
+        Las cadenas se procesan en bloques de tantas como hilos tenga Numba, así
+        la memoria de las cintas y trazas no crece con la cantidad de cadenas.
+        
+        Args:
+            input_strings: Cadenas de entrada a simular
+            record_ids: Si es False no se reservan trazas ni se reproducen los pasos
+            
+        Returns:
+            Iterador con una tupla (descripciones instantáneas, aceptada) por cadena
+        """
+        chunk_size = get_num_threads()
+        for start in range(0, len(input_strings), chunk_size):
+            yield from self._simulate_chunk(input_strings[start:start + chunk_size], record_ids)
+    
+    def _simulate_chunk(self, input_strings: List[str],
+                        record_ids: bool) -> List[Tuple[List[str], bool]]:
+        """
+        Simula un bloque de cadenas en paralelo con el kernel compilado
+        
+        Args:
+            input_strings: Cadenas del bloque
+            record_ids: Si es False no se reservan trazas ni se reproducen los pasos
+            
+        Returns:
+            Lista con una tupla (descripciones instantáneas, aceptada) por cadena
+        """
+        encoded = [bytes(map(self._encode_symbol, input_string)) for input_string in input_strings]
+        
+        # Una fila de cinta por cadena. La cabeza se mueve a lo sumo una celda
+        # por paso, así que MAX_STEPS celdas a cada lado de la entrada bastan
+        size = max(map(len, encoded), default=0) + 2 * MAX_STEPS + 1
+        origin = MAX_STEPS
+        tapes = np.zeros((len(encoded), size), dtype=np.uint8)
+        for row, cells in zip(tapes, encoded):
+            row[origin:origin + len(cells)] = np.frombuffer(cells, dtype=np.uint8)
+        
+        # Sin IDs el kernel no escribe las trazas: basta una columna de relleno
+        trace_length = MAX_STEPS + 1 if record_ids else 1
+        trace_pos = np.empty((len(encoded), trace_length), dtype=np.int64)
+        trace_state = np.empty((len(encoded), trace_length), dtype=np.int64)
+        trace_mem = np.empty((len(encoded), trace_length), dtype=np.int64)
+        trace_write = np.empty((len(encoded), trace_length), dtype=np.uint8)
+        lengths = np.array([len(cells) for cells in encoded], dtype=np.int64)
+        steps, accepted = _run_batch(tapes, origin, lengths, self._state_id[self.initial_state],
+                                     self._keys, self._next_state, self._next_mem,
+                                     self._write_sym, self._disp,
+                                     self._state_id[self.final_state], MAX_STEPS, record_ids,
+                                     trace_pos, trace_state, trace_mem, trace_write)
+        
+        if not record_ids:
+            return [([], bool(row_accepted)) for row_accepted in accepted]
+        
+        results = []
+        for i, cells in enumerate(encoded):
+            n = steps[i] + 1
+            instant_descriptions = self._replay(cells, origin, size, trace_pos[i, :n].tolist(),
+                                                trace_state[i, :n].tolist(), trace_mem[i, :n].tolist(),
+                                                trace_write[i, :n].tolist())
+            results.append((instant_descriptions, bool(accepted[i])))
+        return results
+    
+    def _replay(self, cells: bytes, origin: int, size: int, positions: List[int],
+                states: List[int], mems: List[int], writes: List[int]) -> List[str]:
+        """
+        Reproduce sobre una cinta de caracteres los pasos registrados por el
+        kernel compilado y arma las descripciones instantáneas
+        
+        Args:
+            cells: Ids de la cadena de entrada
+            origin: Celda donde empieza la entrada
+            size: Cantidad de celdas de la cinta
+            positions: Celda de la cabeza tras cada paso (incluye la inicial)
+            states: Id del estado tras cada paso
+            mems: Id de la memoria tras cada paso
+            writes: Id del símbolo escrito en cada paso (el primero se ignora)
+            
+        Returns:
+            Lista de descripciones instantáneas
+        """
+        byte_to_char = self._byte_to_char
+        rendered = bytearray((byte_to_char[0],)) * size
+        rendered[origin:origin + len(cells)] = cells.translate(byte_to_char)
+        lo, hi = origin, origin + max(len(cells), 1)
+        
+        create_id = self._create_instant_description
+        instant_descriptions = [create_id(rendered, lo, origin, hi, states[0], mems[0])]
+        append_id = instant_descriptions.append
+        for cell, head, state_id, mem_id, symbol_id in zip(positions, positions[1:], states[1:],
+                                                            mems[1:], writes[1:]):
+            rendered[cell] = byte_to_char[symbol_id]
+            if head < lo:
+                lo = head
+            elif head >= hi:
+                hi = head + 1
+            append_id(create_id(rendered, lo, head, hi, state_id, mem_id))
+        return instant_descriptions
+    
+    def _create_instant_description(self, rendered: bytearray, 
+                                     start: int, 
+                                     head: int, 
+                                     end: int, 
+                                     state_id: int, 
+                                     mem_id: int) -> str:
+        """
+        Crea una descripción instantánea (ID) de la configuración actual
+        
+        Formato: [estado, mem_cache] símbolo_actual resto_de_la_cinta
+        
+        Args:
+            rendered: Celdas de la cinta ya traducidas a caracteres
+            start: Primera celda usada de la cinta
+            head: Celda bajo la cabeza de lectura/escritura
+            end: Celda siguiente a la última usada
+            state_id: Id del estado actual
+            mem_id: Id del valor en memoria/caché
+            
+        Returns:
+            String con la descripción instantánea
+        """
+        # Construir (o reutilizar) la parte del estado y memoria
+        state_key = (state_id << 16) | mem_id
+        state_part = self._state_parts.get(state_key)
+        if state_part is None:
+            state_part = f"[{self._state_names[state_id]}"
+            mem_cache = self._mem_names[mem_id]
+            if mem_cache is not None:
+                state_part += f",{mem_cache}"
+            state_part += "]"
+            self._state_parts[state_key] = state_part
+        
+        # La cabeza siempre está dentro de las celdas usadas: las celdas blank
+        # que visita se agregan a [start, end) al moverse
+        if self._wide_symbols:
+            return (self._render_tape(rendered[start:head]) + state_part
+                    + self._render_tape(rendered[head:end]))
+        # rendered ya tiene un carácter latin-1 por celda (traducido con
+        # _byte_to_char al escribir), así que basta decodificar
+        return f"{rendered[start:head].decode('latin-1')}{state_part}{rendered[head:end].decode('latin-1')}"
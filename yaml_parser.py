@@ -2,22 +2,113 @@
 Parser para archivos YAML de configuración de Máquinas de Turing
 """
 
-import yaml
-from typing import Dict, Any
+import os
+import pickle
+from typing import Dict, Any, Optional, Tuple, TextIO
+
+# Sufijo del archivo con la configuración ya parseada junto a cada YAML
+CACHE_SUFFIX = '.cache.pkl'
+
+# Protocolo 4: el más alto que puede leer Python 3.7
+CACHE_PROTOCOL = 4
+
+
+class YAMLParseError(Exception):
+    """Error de sintaxis en el archivo YAML (envuelve el yaml.YAMLError original)"""
+
+
+def _parse_yaml(file: TextIO) -> Any:
+    """
+    Parsea el contenido YAML de un archivo abierto
+    
+    PyYAML se importa recién aquí, así una caché válida evita cargarlo.
+    
+    Args:
+        file: Archivo YAML abierto en modo texto
+        
+    Returns:
+        Contenido parseado
+    """
+    import yaml
+    
+    # Usar los bindings de LibYAML (C) si están disponibles
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+    
+    try:
+        return yaml.load(file, Loader=SafeLoader)
+    except yaml.YAMLError as e:
+        raise YAMLParseError(e) from e
+
+
+def _load_cache(cache_path: str, signature: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Carga la configuración cacheada si fue generada a partir del mismo YAML
+    
+    Cualquier error al leer la caché se trata como si no existiera. Ojo: el
+    archivo se deserializa con pickle, que puede ejecutar código arbitrario,
+    así que solo debe usarse con cachés generadas por este programa.
+    
+    Args:
+        cache_path: Ruta al archivo de caché
+        signature: (mtime en ns, tamaño) del archivo YAML
+        
+    Returns:
+        Diccionario con la configuración o None si no hay caché válida
+    """
+    try:
+        with open(cache_path, 'rb') as file:
+            if pickle.load(file) != signature:
+                return None
+            return pickle.load(file)
+    except Exception:
+        return None
+
+
+def _store_cache(cache_path: str, signature: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """
+    Guarda la configuración parseada; si no se puede escribir se ignora
+    
+    Args:
+        cache_path: Ruta al archivo de caché
+        signature: (mtime en ns, tamaño) del archivo YAML
+        config: Configuración ya validada
+    """
+    try:
+        with open(cache_path, 'wb') as file:
+            pickle.dump(signature, file, protocol=CACHE_PROTOCOL)
+            pickle.dump(config, file, protocol=CACHE_PROTOCOL)
+    except OSError:
+        pass
 
 
 def parse_yaml_file(file_path: str) -> Dict[str, Any]:
     """
     Parsea un archivo YAML con la configuración de una MT
     
+    El resultado se cachea en <archivo>.cache.pkl y se reutiliza mientras
+    el YAML no cambie (misma fecha de modificación y tamaño).
+    
     Args:
         file_path: Ruta al archivo YAML
         
     Returns:
         Diccionario con la configuración parseada
+        
+    Raises:
+        YAMLParseError: Si el archivo no es YAML válido
     """
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_path = file_path + CACHE_SUFFIX
+    config = _load_cache(cache_path, signature)
+    if config is not None:
+        return config
+    
     with open(file_path, 'r', encoding='utf-8') as file:
-        config = yaml.safe_load(file)
+        config = _parse_yaml(file)
     
     # Validar estructura básica
     if 'q_states' not in config:
@@ -29,6 +120,7 @@ def parse_yaml_file(file_path: str) -> Dict[str, Any]:
     if 'delta' not in config:
         raise ValueError("El archivo YAML debe contener 'delta'")
     
+    _store_cache(cache_path, signature, config)
     return config
 
 